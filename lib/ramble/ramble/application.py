@@ -1707,8 +1707,9 @@ class ApplicationBase(metaclass=ApplicationMeta):
                     criteria_list.find_criteria(c) for c in file_conf["success_criteria"]
                 ]
 
+                # Stream the log instead of materializing all lines at once
                 with open(file) as f:
-                    for line in f.readlines():
+                    for line in f:
                         logger.debug(f"Line: {line}")
                         new_per_file_crit_objs = []
                         for crit_obj in per_file_crit_objs:
@@ -1824,14 +1825,13 @@ class ApplicationBase(metaclass=ApplicationMeta):
         namespace.
         """
 
-        def is_numeric(value):
-            """Returns true if a fom value is numeric"""
+        def as_numeric(value):
+            """Returns a fom value as a float, or None if it is not numeric"""
 
             try:
-                float(value)
-                return True
+                return float(value)
             except (ValueError, TypeError):
-                return False
+                return None
 
         if not self.repeats.is_repeat_base:
             return
@@ -1865,18 +1865,20 @@ class ApplicationBase(metaclass=ApplicationMeta):
             if n == 1:
                 first_repeat_exp = repeat_exp_namespace
 
-        # If repeat_success_strict is true, one failed experiment will fail the whole set
-        # If repeat_success_strict is false, any passing experiment will pass the whole set
-        repeat_success = False
-        exp_success = []
+        # Resolve each repeat experiment instance once, and reuse the
+        # instances for both the status check and the fom aggregation below
+        repeat_exp_insts = []
         for exp in repeat_experiments.keys():
             if exp in self.experiment_set.experiments.keys():
-                exp_inst = self.experiment_set.experiments[exp]
+                repeat_exp_insts.append(self.experiment_set.experiments[exp])
             elif exp in self.experiment_set.chained_experiments.keys():
-                exp_inst = self.experiment_set.chained_experiments[exp]
-            else:
-                continue
+                repeat_exp_insts.append(self.experiment_set.chained_experiments[exp])
 
+        # If repeat_success_strict is true, one failed experiment will fail the whole set
+        # If repeat_success_strict is false, any passing experiment will pass the whole set
+        repeat_success = False
+        exp_success = []
+        for exp_inst in repeat_exp_insts:
             exp_success.append(exp_inst.get_status())
 
         if workspace.repeat_success_strict:
@@ -1904,14 +1906,7 @@ class ApplicationBase(metaclass=ApplicationMeta):
         results = []
 
         # Iterate through repeat experiment instances, extract foms, and aggregate them
-        for exp in repeat_experiments.keys():
-            if exp in self.experiment_set.experiments.keys():
-                exp_inst = self.experiment_set.experiments[exp]
-            elif exp in self.experiment_set.chained_experiments.keys():
-                exp_inst = self.experiment_set.chained_experiments[exp]
-            else:
-                continue
-
+        for exp_inst in repeat_exp_insts:
             # When strict success is off for repeats (loose success), skip failed exps
             if exp_inst.result.status == experiment_status.FAILED:
                 continue
@@ -1932,10 +1927,11 @@ class ApplicationBase(metaclass=ApplicationMeta):
                         )
 
                         # Stats will not be calculated for non-numeric foms so they're skipped
-                        if is_numeric(foms["value"]):
+                        fom_value = as_numeric(foms["value"])
+                        if fom_value is not None:
                             if fom_key not in repeat_foms[context_name].keys():
                                 repeat_foms[context_name][fom_key] = []
-                            repeat_foms[context_name][fom_key].append(float(foms["value"]))
+                            repeat_foms[context_name][fom_key].append(fom_value)
 
         # Iterate through the aggregated foms, calculate stats, and insert into results
         for context, fom_dict in repeat_foms.items():
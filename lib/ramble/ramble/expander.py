@@ -8,6 +8,7 @@
 
 import string
 import ast
+import keyword
 import operator
 import math
 import random
@@ -674,6 +675,12 @@ class Expander:
             unmodified (if unsuccessful)
 
         """
+        # A bare identifier parses to a name node, which evaluates to
+        # itself. Skip the ast machinery for this common case. Keywords
+        # (True, None, not, ...) are excluded, as they parse to other nodes.
+        if in_str.isidentifier() and not keyword.iskeyword(in_str):
+            return in_str
+
         try:
             math_ast = ast.parse(in_str, mode="eval")
             out_str = self.eval_math(math_ast.body)
@@ -52,14 +52,14 @@ class ExperimentResult:
         The generated dict preserves the existing serialized format
         so that previous result files work as expected.
         """
-        import copy
-
-        obj_dict = copy.deepcopy(self.__dict__)
-        if "keys" in obj_dict:
-            res = obj_dict["keys"]
+        # The attribute values are only read by the encoders, so a shallow
+        # copy of the keys dict is all that is needed to avoid mutating
+        # this result while building the output dict.
+        if "keys" in self.__dict__:
+            res = dict(self.keys)
         else:
             res = {}
-        for name, val in obj_dict.items():
+        for name, val in self.__dict__.items():
             if name in _DICT_MAPPING:
                 res[_DICT_MAPPING[name]] = val
 
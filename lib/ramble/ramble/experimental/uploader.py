@@ -32,14 +32,22 @@ class Uploader:
         pass
 
 
+_user = None
+
+
 def get_user():
-    config_user = ramble.config.get("config:user")
-    if config_user:
-        return config_user
-    else:
-        import getpass
+    # The user cannot change within a run, so resolve it once and share the
+    # same string across every uploaded experiment.
+    global _user
+    if _user is None:
+        config_user = ramble.config.get("config:user")
+        if config_user:
+            _user = config_user
+        else:
+            import getpass
 
-        return getpass.getuser()
+            _user = getpass.getuser()
+    return _user
 
 
 class Experiment:
@@ -96,10 +104,9 @@ class Experiment:
 
     def to_json(self):
 
-        # deep copy so the assignment below doesn't affect the foms array
-        import copy
-
-        j = copy.deepcopy(self.__dict__)
+        # A shallow copy is sufficient here, since the assignments below only
+        # rebind keys on the copy and never mutate the underlying values.
+        j = dict(self.__dict__)
 
         j["foms"] = json.dumps(self.foms)
         j["data"] = json.dumps(self.data)
@@ -124,7 +131,7 @@ def determine_node_type(experiment, contexts):
 
         # Termination condition
         if experiment.node_type != default_node_type_val:
-            continue
+            break
 
 
 def upload_results(results):
@@ -185,9 +192,9 @@ def format_data(data_in):
 
     current_dateTime = datetime.now()
 
-    for exp in data_in["experiments"]:
+    upload_failed = ramble.config.get("config:upload:push_failed")
 
-        upload_failed = ramble.config.get("config:upload:push_failed")
+    for exp in data_in["experiments"]:
 
         if exp["RAMBLE_STATUS"] == "SUCCESS" or upload_failed:
             e = Experiment(exp["name"], data_in["workspace_hash"], exp, current_dateTime)
@@ -256,7 +263,7 @@ class BigQueryUploader(Uploader):
         if rows_per_batch <= 1:
             rows_per_batch = 1
 
-        logger.debug(f"Size: {sys.getsizeof(json.dumps(data))}B")
+        logger.debug(f"Size: {approx_request_size}B")
         logger.debug(f"Length in rows: {data_len}")
         logger.debug(f"Num Batches: {approx_num_batches}")
         logger.debug(f"Rows per Batch: {rows_per_batch}")
@@ -377,15 +377,17 @@ class ExecutableGraph(AttributeGraph):
             )
 
         if relative is not None:
-            relative_error = False
-            if relative not in self.node_definitions:
-                relative_error = True
+            relative_node = self.node_definitions.get(relative)
 
-            relative_node = self.node_definitions[relative]
-            if relative_node not in cur_exec_order:
-                relative_error = True
+            # Locate the relative node with a single scan of the ordering
+            order_index = None
+            if relative_node is not None:
+                try:
+                    order_index = cur_exec_order.index(relative_node)
+                except ValueError:
+                    pass
 
-            if relative_error:
+            if order_index is None:
                 logger.die(
                     "In experiment "
                     f'"{exp_name}" '
@@ -393,9 +395,6 @@ class ExecutableGraph(AttributeGraph):
                     f'relative to a non existing executable "{relative}".'
                 )
 
-            relative_node = self.node_definitions[relative]
-            order_index = cur_exec_order.index(relative_node)
-
             if order == self.supported_injection_orders.before:
                 super().update_graph(relative_node, [exec_node])
                 if order_index > 0:
@@ -267,13 +267,12 @@ class ModifierBase(metaclass=ModifierMeta):
     def applies_to_executable(self, executable):
         apply = False
 
-        mod_regex = re.compile(self._mod_prefix_builtin + f"{self.name}{NS_SEPARATOR}")
+        builtin_prefix = self._mod_prefix_builtin + f"{self.name}{NS_SEPARATOR}"
         for pattern in self._on_executables:
             if fnmatch.fnmatch(executable, pattern):
                 apply = True
 
-        exec_match = mod_regex.match(executable)
-        if exec_match:
+        if executable.startswith(builtin_prefix):
             apply = True
 
         return apply
@@ -189,7 +189,12 @@ class Logger:
 
         Pass all args and kwargs to tty.debug (which will concatenate and
         print). Perform this action for the active log only.
+
+        When debug output is disabled this returns immediately, to avoid
+        paying for stream and color setup on hot paths.
         """
+        if not tty.is_debug():
+            return
         st_kwargs = self._stream_kwargs(default_kwargs=kwargs)
         with self.configure_colors(**st_kwargs):
             tty.debug(*args, **st_kwargs)
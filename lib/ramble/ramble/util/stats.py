@@ -24,8 +24,9 @@ def max_decimal_places(list):
 
     max = 0
     for val in list:
-        if decimal_places(val) > max:
-            max = decimal_places(val)
+        places = decimal_places(val)
+        if places > max:
+            max = places
     return max
 
 
@@ -103,9 +104,7 @@ class StatsCoefficientOfVariation(StatsBase):
         # calculate anyway and leave the interpretation to individual experiments.
         if not mean:
             return "NA"
-        return round(
-            statistics.stdev(values) / statistics.mean(values), max_decimal_places(values)
-        )
+        return round(statistics.stdev(values) / mean, max_decimal_places(values))
 
     def get_unit(self, unit):
         # `unit` unused
@@ -9,6 +9,7 @@
 import os
 import re
 import shutil
+import stat
 import sys
 
 from ramble.application import ApplicationError
@@ -16,7 +17,7 @@ from ramble.pkgmankit import *
 
 import ramble.config
 from ramble.error import RambleError
-from ramble.util.executable import which
+from ramble.util.executable import PrefixedExecutable, which
 from ramble.util.hashing import hash_file, hash_string
 from ramble.util.logger import logger
 from ramble.util.shell_utils import source_str
@@ -212,6 +213,8 @@ package_name_regex = re.compile(
     r"\s*(?P<pkg_name>[A-Z0-9][A-Z0-9._-]*[A-Z0-9]|[A-Z0-9]).*", re.IGNORECASE
 )
 
+pip_version_regex = re.compile(r"pip (?P<version>[\d.]+) from")
+
 
 def _extract_pkg_name(pkg_spec):
     """Best-effort to extract pkg name from spec
@@ -240,9 +243,14 @@ class PipRunner:
         self.dry_run = dry_run
         self.specs = set()
         self.installed = False
+        self._venv_python_cache = {}
+        self._last_lock_content = None
+        self._requirement_content_cache = None
 
     def configure_env(self, path):
         """Configure the venv path for subsequent commands"""
+        if path != self.env_path:
+            self._last_lock_content = None
         self.env_path = path
 
     def set_dry_run(self, dry_run=False):
@@ -251,18 +259,20 @@ class PipRunner:
 
     def create_env(self, env_path):
         """Ensure a venv environment is created"""
-        if os.path.exists(env_path) and not os.path.isdir(env_path):
-            raise RunnerError(f"Unable to create environment {env_path}")
-
-        if not os.path.exists(env_path):
+        # A single stat distinguishes missing, non-directory, and directory
+        # paths, instead of paying for several syscalls on (potentially
+        # networked) filesystems.
+        try:
+            if not stat.S_ISDIR(os.stat(env_path).st_mode):
+                raise RunnerError(f"Unable to create environment {env_path}")
+        except FileNotFoundError:
             fs.mkdirp(env_path)
 
         if not self.dry_run:
-            if not os.path.exists(os.path.join(env_path, self._venv_name)):
+            venv_path = os.path.join(env_path, self._venv_name)
+            if not os.path.isdir(venv_path):
                 bs_python = self.get_bootstrap_python()
-                bs_python(
-                    "-m", "venv", os.path.join(env_path, self._venv_name)
-                )
+                bs_python("-m", "venv", venv_path)
 
         # Ensure subsequent commands use the created env now.
         self.env_path = env_path
@@ -270,9 +280,14 @@ class PipRunner:
     def _get_venv_python(self):
         if self.dry_run:
             return self.get_bootstrap_python().copy()
-        return Executable(
-            os.path.join(self.env_path, self._venv_name, "bin", "python")
-        )
+        venv_python = self._venv_python_cache.get(self.env_path)
+        if venv_python is None:
+            venv_python = PrefixedExecutable(
+                os.path.join(self.env_path, self._venv_name, "bin", "python")
+            )
+            self._venv_python_cache[self.env_path] = venv_python
+        # Callers may add default args, so hand out a copy of the cached exe
+        return venv_python.copy()
 
     def install(self):
         """Invoke pip install"""
@@ -297,8 +312,12 @@ class PipRunner:
         else:
             installer(*install_args)
             lock_file = os.path.join(self.env_path, self._lock_file_name)
+            lock_content = installer(*freeze_args, output=str)
             with open(lock_file, "w") as f:
-                installer(*freeze_args, output=f)
+                f.write(lock_content)
+            # Keep the content around so inventory_hash can avoid
+            # re-reading the lock file that was just written.
+            self._last_lock_content = lock_content
         self.installed = True
 
     def get_bootstrap_python(self):
@@ -331,9 +350,12 @@ class PipRunner:
         return ["deactivate"]
 
     def _generate_requirement_content(self):
-        contents = os.linesep.join(sorted(self.specs))
-        contents += os.linesep
-        return contents
+        # Re-sort the specs only when add_spec has changed them
+        if self._requirement_content_cache is None:
+            contents = os.linesep.join(sorted(self.specs))
+            contents += os.linesep
+            self._requirement_content_cache = contents
+        return self._requirement_content_cache
 
     def generate_requirement_file(self):
         """Generate a requirements.txt file"""
@@ -341,15 +363,21 @@ class PipRunner:
         contents = self._generate_requirement_content()
         req_file = os.path.join(self.env_path, self._requirement_file_name)
         lock_file = os.path.join(self.env_path, self._lock_file_name)
-        if os.path.exists(req_file) and os.path.exists(lock_file):
-            existing_req_mtime = os.path.getmtime(req_file)
-            existing_lock_mtime = os.path.getmtime(lock_file)
-            if existing_lock_mtime >= existing_req_mtime:
-                with open(req_file, "r") as f:
-                    if f.read() == contents:
-                        self.installed = True
-                        logger.debug("requirement file already up-to-date")
-                        return
+        # One stat per file covers both the existence and mtime checks
+        try:
+            existing_req_mtime = os.stat(req_file).st_mtime
+            existing_lock_mtime = os.stat(lock_file).st_mtime
+        except FileNotFoundError:
+            existing_lock_mtime = None
+        if (
+            existing_lock_mtime is not None
+            and existing_lock_mtime >= existing_req_mtime
+        ):
+            with open(req_file, "r") as f:
+                if f.read() == contents:
+                    self.installed = True
+                    logger.debug("requirement file already up-to-date")
+                    return
         with open(req_file, "w") as f:
             f.write(contents)
 
@@ -396,7 +424,7 @@ class PipRunner:
             raise RunnerError(f"Lock file {lock_file} is missing")
         pkgs = []
         with open(lock_file, "r") as f:
-            for line in f.readlines():
+            for line in f:
                 # pip freeze generates such a comment, which serves as a divider
                 # for packages that are added as deps of the ones defined directly.
                 # This is a crude way to avoid defining path vars for
@@ -450,16 +478,16 @@ class PipRunner:
     def add_spec(self, spec):
         """Add a package spec to the pip environment"""
         self._check_env_configured()
-        self.specs.add(spec)
+        if spec not in self.specs:
+            self.specs.add(spec)
+            self._requirement_content_cache = None
 
     def get_version(self):
         if self.dry_run:
             return "unknown"
         exe = self._get_venv_python()
         out = exe("-m", "pip", "--version", output=str)
-        match = re.search(r"pip (?P<version>[\d.]+) from", out).group(
-            "version"
-        )
+        match = pip_version_regex.search(out).group("version")
         return match
 
     def inventory_hash(self):
@@ -467,6 +495,8 @@ class PipRunner:
         self._check_env_configured()
         if self.dry_run:
             return hash_string(self._generate_requirement_content())
+        elif self._last_lock_content is not None:
+            return hash_string(self._last_lock_content)
         else:
             return hash_file(os.path.join(self.env_path, self._lock_file_name))
 
@@ -481,8 +511,7 @@ class PipRunner:
                     pkgs.add(pkg_name)
         else:
             with open(os.path.join(self.env_path, self._lock_file_name)) as f:
-                reqs = f.readlines()
-                for req in reqs:
+                for req in f:
                     if "==" in req:
                         pkgs.add(req.split("==")[0].strip())
         return pkgs